@@ -33,6 +33,9 @@ a = Analysis(
         'openpyxl',
         'openpyxl.styles',
         'openpyxl.utils',
+        'python_calamine',
+        'pyarrow',
+        'pyarrow.compute',
         # Your modules
         'index',
         'file_utils',
@@ -1,19 +1,67 @@
 import pandas as pd
+import numpy as np
+import math
 import re
 import os
+import zipfile
+import xml.etree.ElementTree as ET
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from openpyxl import load_workbook
 from openpyxl.styles import PatternFill
 
 # Import our atomic file utilities for safe file operations
-# This protects against file corruption during unexpected shutdowns
-from file_utils import atomic_save_workbook
+# This protects against file corruption during unexpected shutdowns.
+# The buffered variant serializes the workbook to memory once, then
+# preallocates and writes the file in a single pass — the cheapest
+# way to get the rewritten zip onto disk on the per-request save path.
+from file_utils import atomic_save_workbook_buffered
 
 # --- Configuration ---
-IGNORED_COLUMNS = ['LOT #'] 
-NOISE_THRESHOLD = 0.5 
+IGNORED_COLUMNS = ['LOT #']
+NOISE_THRESHOLD = 0.5
 
+# Sheets named like "1.2" / "12.31"; compiled once so the per-file scan
+# never touches the re module cache.
+_SHEET_RE = re.compile(r"^\d{1,2}\.\d{1,2}")
+
+# One shared fill object for all highlighted cells. openpyxl dedupes
+# styles by object identity first, so reusing a single instance keeps
+# the workbook style table small and skips per-call construction.
+_YELLOW_FILL = PatternFill(start_color="FFFF00", end_color="FFFF00", fill_type="solid")
+
+# Prefer the calamine engine (Rust XLSX parser, much faster and leaner
+# than openpyxl) for read-only parsing when python-calamine is
+# installed; highlighting still goes through openpyxl since calamine
+# cannot write.
+try:
+    import python_calamine  # noqa: F401
+    _EXCEL_READ_ENGINE = 'calamine'
+except ImportError:
+    _EXCEL_READ_ENGINE = 'openpyxl'
+
+# Arrow keeps the row-signature work in columnar buffers with no
+# per-row Python strings. The pandas->arrow conversion has a fixed
+# cost, so it only pays off past this many rows.
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+except ImportError:
+    pa = None
+_ARROW_MIN_ROWS = 50_000
+
+@lru_cache(maxsize=4096, typed=True)
 def normalize_value(val):
-    """Standardizes data for comparison."""
+    """
+    Standardizes data for comparison.
+
+    Cached because the remaining scalar callers (header mapping, the
+    object-dtype branch of _normalize_series) see the same values over
+    and over; categorical Excel data makes the hit rate very high.
+    typed=True keeps bool/int/float keys distinct — True == 1.0 in
+    Python, but they must not share a cache entry ("True" vs "1").
+    """
     if pd.isna(val):
         return "" 
     if isinstance(val, float) and val.is_integer():
@@ -22,13 +70,44 @@ def normalize_value(val):
         return str(val)
     return str(val).strip()
 
-def get_target_sheets(file_path):
-    """Finds the last two sheets matching the pattern."""
+def _normalize_series(series):
+    """
+    Column-wise version of normalize_value.
+
+    Applies the same rules (NaN -> "", integral floats -> "10",
+    everything else -> stripped string) to a whole column at once so
+    callers comparing thousands of rows stay in C loops instead of
+    calling normalize_value once per cell.
+    """
+    if pd.api.types.is_numeric_dtype(series):
+        out = series.astype(str)
+        if pd.api.types.is_float_dtype(series):
+            # Integral floats should render as "10", not "10.0"
+            mask_int = series.notna() & (series % 1 == 0)
+            if mask_int.any():
+                out.loc[mask_int] = series.loc[mask_int].map(lambda v: str(int(v)))
+        return out.mask(series.isna(), "")
+    # Object columns can mix strings, numbers and NaN; map() is a single
+    # C-level pass over the scalar normalizer.
+    return series.map(normalize_value)
+
+def get_target_sheets(source):
+    """
+    Finds the last two sheets matching the pattern.
+
+    Accepts a file path or an already-open pd.ExcelFile; passing the
+    latter avoids decompressing and parsing the workbook again.
+    """
     try:
-        xls = pd.ExcelFile(file_path, engine='openpyxl')
+        if hasattr(source, 'sheet_names'):
+            xls = source
+        else:
+            xls = pd.ExcelFile(source, engine=_EXCEL_READ_ENGINE)
         all_sheets = xls.sheet_names
-        pattern = r"^\d{1,2}\.\d{1,2}"
-        target_sheets = [name for name in all_sheets if re.match(pattern, name)]
+        # The leading-digit check rejects 'Cover'/'Instructions' style
+        # names without entering the regex engine at all.
+        target_sheets = [name for name in all_sheets
+                         if name[:1].isdigit() and _SHEET_RE.match(name)]
         
         if len(target_sheets) < 2:
             print(f"Error: Need at least 2 matching sheets. Found: {len(target_sheets)}")
@@ -41,52 +120,79 @@ def get_target_sheets(file_path):
 def get_common_columns_map(df_prev, df_curr):
     """Identifies common columns by Header Name."""
     def get_header_map(df):
-        row_series = df.iloc[0] 
-        value_map = {}
-        for col_index, val in row_series.items():
-            clean_val = normalize_value(val)
-            if clean_val and clean_val not in IGNORED_COLUMNS: 
-                if clean_val not in value_map:
-                    value_map[clean_val] = []
+        value_map = defaultdict(list)
+        for col_index, val in df.iloc[0].items():
+            # Headers are nearly always strings; skip the isinstance
+            # ladder in normalize_value on that common case.
+            clean_val = val.strip() if isinstance(val, str) else normalize_value(val)
+            if clean_val and clean_val not in IGNORED_COLUMNS:
                 value_map[clean_val].append(col_index)
         return value_map
 
     map_prev = get_header_map(df_prev)
     map_curr = get_header_map(df_curr)
-    common_values = set(map_prev.keys()) & set(map_curr.keys())
-    
+
+    # Intersect by walking the smaller map and probing the other; no
+    # temporary set allocations.
+    smaller = map_prev if len(map_prev) <= len(map_curr) else map_curr
+    other = map_curr if smaller is map_prev else map_prev
+
     results = {}
-    for val in common_values:
-        results[val] = {
-            "prev_indices": sorted(map_prev[val]),
-            "curr_indices": sorted(map_curr[val])
-        }
+    for val in smaller:
+        if val in other:
+            results[val] = {
+                "prev_indices": sorted(map_prev[val]),
+                "curr_indices": sorted(map_curr[val])
+            }
     return results
 
 def filter_noisy_columns(df_prev, df_curr, matches_data):
     """Removes columns if they change too much between sheets."""
     clean_matches = {}
-    data_prev = df_prev.iloc[1:].reset_index(drop=True)
-    data_curr = df_curr.iloc[1:].reset_index(drop=True)
-    min_len = min(len(data_prev), len(data_curr))
-    
-    if min_len == 0:
-        return matches_data 
+    # Row 0 is the header; everything after is data. Slice each matched
+    # column directly out of the raw frames rather than materializing
+    # full-width .iloc[1:].reset_index() copies of both sheets.
+    min_len = min(len(df_prev), len(df_curr)) - 1
+
+    if min_len <= 0:
+        return matches_data
 
     print("\n--- Checking for Noisy Columns ---")
-    for col_name, indices in matches_data.items():
-        idx_prev = indices['prev_indices'][0]
-        idx_curr = indices['curr_indices'][0]
-        col_vals_prev = data_prev.iloc[:min_len, idx_prev].apply(normalize_value).tolist()
-        col_vals_curr = data_curr.iloc[:min_len, idx_curr].apply(normalize_value).tolist()
+    col_names = list(matches_data.keys())
+    # A column is noisy as soon as its diff count reaches this many
+    # rows; scanning further can't change the verdict. Compare in
+    # vectorized blocks and retire columns the moment they cross the
+    # line, so very long sheets don't pay for rows that no longer
+    # matter.
+    threshold_count = math.ceil(NOISE_THRESHOLD * min_len)
+    block_rows = 4096
 
-        diff_count = sum(1 for p, c in zip(col_vals_prev, col_vals_curr) if p != c)
-        change_ratio = diff_count / min_len
+    diff_counts = np.zeros(len(col_names), dtype=np.int64)
+    undecided = list(range(len(col_names)))
 
-        if change_ratio >= NOISE_THRESHOLD:
+    for start in range(1, 1 + min_len, block_rows):
+        if not undecided:
+            break
+        stop = min(start + block_rows, 1 + min_len)
+        remaining = []
+        for j in undecided:
+            name = col_names[j]
+            prev_col = _normalize_series(
+                df_prev.iloc[start:stop, matches_data[name]['prev_indices'][0]]).to_numpy()
+            curr_col = _normalize_series(
+                df_curr.iloc[start:stop, matches_data[name]['curr_indices'][0]]).to_numpy()
+            diff_counts[j] += np.count_nonzero(prev_col != curr_col)
+            if diff_counts[j] < threshold_count:
+                remaining.append(j)
+        undecided = remaining
+
+    for j, col_name in enumerate(col_names):
+        if diff_counts[j] >= threshold_count:
+            # Early-retired columns report a lower bound on the ratio.
+            change_ratio = diff_counts[j] / min_len
             print(f"Ignoring '{col_name}': {change_ratio:.0%} of rows changed")
         else:
-            clean_matches[col_name] = indices
+            clean_matches[col_name] = matches_data[col_name]
     return clean_matches
 
 def generate_signatures(df, matches_data, sheet_key):
@@ -96,20 +202,136 @@ def generate_signatures(df, matches_data, sheet_key):
     for key in sorted_keys:
         target_columns.extend(matches_data[key][sheet_key])
 
-    signatures = []
     data_df = df.iloc[1:]
-    
-    for _, row in data_df.iterrows():
-        row_values = []
-        for col_idx in target_columns:
-            if col_idx < len(row):
-                val = normalize_value(row.iloc[col_idx])
-                row_values.append(val)
-            else:
-                row_values.append("")
-        signature = "-".join(row_values)
-        signatures.append(signature)
-    return signatures
+    n_rows = len(data_df)
+    n_cols = df.shape[1]
+
+    if not target_columns or n_rows == 0:
+        return [""] * n_rows
+
+    # Normalize each target column in one vectorized pass; out-of-bounds
+    # indices contribute an empty string, matching the old per-row check.
+    parts = []
+    for col_idx in target_columns:
+        if col_idx < n_cols:
+            parts.append(_normalize_series(data_df.iloc[:, col_idx]).to_numpy())
+        else:
+            parts.append(np.full(n_rows, "", dtype=object))
+
+    # Join columns element-wise ("A-B-C") without building per-row lists.
+    signatures = parts[0]
+    for part in parts[1:]:
+        signatures = signatures + "-" + part
+    return signatures.tolist()
+
+_NS_MAIN = '{http://schemas.openxmlformats.org/spreadsheetml/2006/main}'
+_NS_REL = '{http://schemas.openxmlformats.org/officeDocument/2006/relationships}'
+_NS_PKG = '{http://schemas.openxmlformats.org/package/2006/relationships}'
+
+def _sheets_identical_in_zip(file_path, sheet_prev, sheet_curr):
+    """
+    True when the two sheets' XML parts are byte-identical inside the
+    xlsx zip. The CRC32 and size of every member are already stored in
+    the zip central directory, so this costs two small XML reads and no
+    decompression of the sheets themselves. Any failure to resolve the
+    parts returns False and the full diff runs.
+    """
+    try:
+        with zipfile.ZipFile(file_path) as zf:
+            rels_root = ET.fromstring(zf.read('xl/_rels/workbook.xml.rels'))
+            targets = {rel.get('Id'): rel.get('Target')
+                       for rel in rels_root.findall(f'{_NS_PKG}Relationship')}
+
+            wb_root = ET.fromstring(zf.read('xl/workbook.xml'))
+            checksums = {}
+            for sheet in wb_root.find(f'{_NS_MAIN}sheets').findall(f'{_NS_MAIN}sheet'):
+                name = sheet.get('name')
+                if name in (sheet_prev, sheet_curr):
+                    target = targets[sheet.get(f'{_NS_REL}id')]
+                    # Targets are usually relative to xl/; absolute
+                    # targets start with a slash.
+                    member = target.lstrip('/') if target.startswith('/') else 'xl/' + target
+                    info = zf.getinfo(member)
+                    checksums[name] = (info.CRC, info.file_size)
+
+            return (len(checksums) == 2
+                    and checksums[sheet_prev] == checksums[sheet_curr])
+    except Exception:
+        return False
+
+def _normalized_columns(df, matches_data, sheet_key):
+    """
+    Normalized object arrays for the matched columns, in sorted-key
+    order. Out-of-bounds indices yield all-empty columns, matching the
+    per-row bounds check generate_signatures used to do.
+    """
+    target_columns = []
+    for key in sorted(matches_data.keys()):
+        target_columns.extend(matches_data[key][sheet_key])
+
+    data_df = df.iloc[1:]
+    n_rows = len(data_df)
+    n_cols = df.shape[1]
+
+    columns = []
+    for col_idx in target_columns:
+        if col_idx < n_cols:
+            columns.append(_normalize_series(data_df.iloc[:, col_idx]).to_numpy())
+        else:
+            columns.append(np.full(n_rows, "", dtype=object))
+    return columns
+
+def _row_hash_pair(df_prev, df_curr, matches_data):
+    """
+    Per-row identity hashes for both sheets, built from integer codes.
+
+    Each matched column is factorized on the prev sheet and the curr
+    column is encoded against the same categories, so equal normalized
+    values share a code and values never seen in prev get -1 (changed
+    by definition). Row identity is then hashed from the (N, K) int32
+    code matrices — mixing small ints is far cheaper and more
+    cache-friendly than hashing the normalized strings themselves.
+    Positional column labels make the two hash arrays comparable even
+    when the matched columns sit at different indices in each sheet.
+    """
+    cols_prev = _normalized_columns(df_prev, matches_data, 'prev_indices')
+    cols_curr = _normalized_columns(df_curr, matches_data, 'curr_indices')
+
+    codes_prev = {}
+    codes_curr = {}
+    for pos, (col_prev, col_curr) in enumerate(zip(cols_prev, cols_curr)):
+        prev_codes, uniques = pd.factorize(col_prev)
+        curr_codes = pd.Index(uniques).get_indexer(col_curr)
+        codes_prev[pos] = prev_codes.astype(np.int32, copy=False)
+        codes_curr[pos] = curr_codes.astype(np.int32, copy=False)
+
+    frame_prev = pd.DataFrame(codes_prev)
+    frame_curr = pd.DataFrame(codes_curr)
+    return (pd.util.hash_pandas_object(frame_prev, index=False).to_numpy(),
+            pd.util.hash_pandas_object(frame_curr, index=False).to_numpy())
+
+def _arrow_changed_mask(df_prev, df_curr, matches_data):
+    """
+    Arrow-backed membership test for large sheets.
+
+    Joins the normalized columns into a single columnar string array
+    per sheet and runs the set membership with pc.is_in — all
+    SIMD-accelerated C++, with no per-row Python string ever built.
+    """
+    def join(columns):
+        arrays = [pa.array(col, type=pa.string()) for col in columns]
+        if len(arrays) == 1:
+            return arrays[0]
+        # Join on the ASCII unit separator, not "-": cell values can
+        # contain dashes, and a straddling value ("a-b","c" vs
+        # "a","b-c") must not collide. Keeps this engine in agreement
+        # with the per-column factorize path.
+        return pc.binary_join_element_wise(*arrays, "\x1f")
+
+    sig_prev = join(_normalized_columns(df_prev, matches_data, 'prev_indices'))
+    sig_curr = join(_normalized_columns(df_curr, matches_data, 'curr_indices'))
+    in_prev = pc.is_in(sig_curr, value_set=sig_prev)
+    return np.logical_not(in_prev.to_numpy(zero_copy_only=False))
 
 def highlight_rows(file_path, sheet_name, indices):
     """
@@ -122,34 +344,46 @@ def highlight_rows(file_path, sheet_name, indices):
             return
 
         ws = wb[sheet_name]
-        yellow_fill = PatternFill(start_color="FFFF00", end_color="FFFF00", fill_type="solid")
 
         print(f"\nHighlighting {len(indices)} rows in '{sheet_name}'...")
 
-        # Calculate offset: 
+        # Calculate offset:
         # skiprows=1 means Excel Row 1 is skipped.
         # DataFrame Index 0 is Excel Row 2 (Header).
         # DataFrame Index 1 is Excel Row 3 (Data).
         # Formula: Excel Row = DataFrame Index + 2
-        for idx in indices:
-            excel_row = idx + 2
-            # Iterate through all cells in that row and color them
-            for cell in ws[excel_row]:
-                cell.fill = yellow_fill
+        #
+        # Merge the target rows into contiguous runs and stream each
+        # run with one iter_rows call. Changed rows tend to cluster, so
+        # this touches neither untouched gap rows nor the per-row
+        # ws[excel_row] dimension lookup.
+        rows_to_touch = sorted({idx + 2 for idx in indices})
+        i = 0
+        n = len(rows_to_touch)
+        while i < n:
+            start = end = rows_to_touch[i]
+            while i + 1 < n and rows_to_touch[i + 1] == end + 1:
+                i += 1
+                end += 1
+            for row in ws.iter_rows(min_row=start, max_row=end):
+                for cell in row:
+                    cell.fill = _YELLOW_FILL
+            i += 1
 
         # =====================================================================
         # ATOMIC SAVE: Use atomic write pattern for data protection
         # =====================================================================
         # Instead of wb.save(file_path) which writes directly to the file,
-        # we use atomic_save_workbook() which:
-        # 1. Writes to a temporary file in the same directory
-        # 2. Atomically renames the temp file to the target
+        # we use atomic_save_workbook_buffered() which:
+        # 1. Serializes the workbook to memory in one pass
+        # 2. Preallocates and writes a temporary file in one syscall
+        # 3. Atomically renames the temp file to the target
         #
         # This ensures that if the application is closed during the save:
         # - The original file is never corrupted
         # - Either the old version or new version exists, never a partial file
         # =====================================================================
-        atomic_save_workbook(wb, file_path)
+        atomic_save_workbook_buffered(wb, file_path)
         print("File saved successfully with highlights (atomic write).")
         
     except Exception as e:
@@ -163,14 +397,70 @@ def get_changed_rows(filename):
         print("File not found.")
         return None
 
-    prev_sheet_name, curr_sheet_name = get_target_sheets(file_path)
+    # The result is a pure function of the file content, so repeated
+    # requests for an unchanged file (the UI re-posts on every click)
+    # are answered from cache. Keying on (path, mtime_ns, size) makes
+    # any rewrite of the file a cache miss — including our own
+    # highlight save, which bumps the mtime.
+    try:
+        st = os.stat(file_path)
+    except OSError:
+        return _compute_changed_rows(file_path)
+    return _cached_changed_rows(file_path, st.st_mtime_ns, st.st_size)
+
+@lru_cache(maxsize=64)
+def _cached_changed_rows(file_path, mtime_ns, size):
+    return _compute_changed_rows(file_path)
+
+def _compute_changed_rows(file_path):
+    # Open the workbook once and reuse the parsed handle for both sheet
+    # discovery and the two reads; pd.read_excel accepts an ExcelFile and
+    # skips re-parsing the zip/XML each time.
+    try:
+        xls = pd.ExcelFile(file_path, engine=_EXCEL_READ_ENGINE)
+    except Exception as e:
+        print(f"Error opening workbook: {e}")
+        xls = None
+    source = file_path if xls is None else xls
+
+    try:
+        return _diff_sheets(file_path, source)
+    finally:
+        if xls is not None:
+            xls.close()
+
+def _diff_sheets(file_path, source):
+    """Diff logic for get_changed_rows, given an open ExcelFile (or path)."""
+    prev_sheet_name, curr_sheet_name = get_target_sheets(source)
     if not prev_sheet_name:
         return None
 
+    # Free "no diff" gate: byte-identical sheet XML means identical
+    # content, so skip parsing and highlighting entirely.
+    if _sheets_identical_in_zip(file_path, prev_sheet_name, curr_sheet_name):
+        print("Sheets are byte-identical; no changes.")
+        return pd.DataFrame()
+
     print(f"Processing: '{prev_sheet_name}' -> '{curr_sheet_name}'")
 
-    df_prev = pd.read_excel(file_path, sheet_name=prev_sheet_name, header=None, skiprows=1)
-    df_curr = pd.read_excel(file_path, sheet_name=curr_sheet_name, header=None, skiprows=1)
+    if isinstance(source, pd.ExcelFile):
+        # The two sheet reads are independent, mostly-C work that
+        # releases the GIL, so run them on two threads. ExcelFile
+        # handles aren't safe for concurrent reads, so each worker
+        # parses from its own handle.
+        def read_sheet(sheet_name):
+            with pd.ExcelFile(file_path, engine=_EXCEL_READ_ENGINE) as own_xls:
+                return pd.read_excel(own_xls, sheet_name=sheet_name,
+                                     header=None, skiprows=1)
+
+        with ThreadPoolExecutor(max_workers=2) as ex:
+            future_prev = ex.submit(read_sheet, prev_sheet_name)
+            future_curr = ex.submit(read_sheet, curr_sheet_name)
+            df_prev = future_prev.result()
+            df_curr = future_curr.result()
+    else:
+        df_prev = pd.read_excel(source, sheet_name=prev_sheet_name, header=None, skiprows=1)
+        df_curr = pd.read_excel(source, sheet_name=curr_sheet_name, header=None, skiprows=1)
 
     matches_data = get_common_columns_map(df_prev, df_curr)
     if not matches_data:
@@ -183,14 +473,13 @@ def get_changed_rows(filename):
         return None
 
     print("\nGenerating signatures...")
-    sigs_prev = set(generate_signatures(df_prev, matches_data, 'prev_indices'))
-    sigs_curr = generate_signatures(df_curr, matches_data, 'curr_indices')
-
-    changed_indices = []
-    for idx, sig in enumerate(sigs_curr):
-        if sig not in sigs_prev:
-            # +1 because sigs_curr starts from df.iloc[1]
-            changed_indices.append(idx + 1) 
+    if pa is not None and len(df_curr) > _ARROW_MIN_ROWS:
+        changed_mask = _arrow_changed_mask(df_prev, df_curr, matches_data)
+    else:
+        hashes_prev, hashes_curr = _row_hash_pair(df_prev, df_curr, matches_data)
+        changed_mask = ~np.isin(hashes_curr, hashes_prev)
+    # +1 because hashed rows start from df.iloc[1]
+    changed_indices = (np.nonzero(changed_mask)[0] + 1).tolist()
 
     if changed_indices:
         # Call the new highlighter function
@@ -1,55 +1,142 @@
 import sys
 import os
+import asyncio
+import logging
+from concurrent.futures import ProcessPoolExecutor
+
 import uvicorn
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Body, Response
 from pydantic import BaseModel
 
-# Add current directory to path so we can import index.py
-sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+# Add this directory to the FRONT of the path so we can import index.py.
+# __file__ is already absolute under normal/frozen launches, so skip the
+# abspath (and its getcwd syscall); insert(0) makes sure our local
+# index.py wins over any same-named module in site-packages.
+_HERE = os.path.dirname(__file__) or "."
+sys.path.insert(0, _HERE)
+
+# Only warnings and above reach stdout; info-level messages (e.g.
+# per-file cleanup notices from file_utils) are filtered before any
+# string formatting happens
+logging.basicConfig(level=logging.WARNING)
 
 # Import your existing logic
 from index import get_changed_rows
+from file_utils import cleanup_orphaned_temp_files_many
 
 app = FastAPI()
 
-class ProcessRequest(BaseModel):
-    file_path: str
+# Worker pool for batch processing. openpyxl parsing is CPU-bound and
+# holds the GIL, so separate processes (not threads) are what lets N
+# files actually overlap. Workers are only spawned on first use.
+EXECUTOR = ProcessPoolExecutor(max_workers=os.cpu_count())
+
+class BatchRequest(BaseModel):
+    file_paths: list[str]
+
+@app.on_event("startup")
+def startup_cleanup():
+    """
+    Sweep temp files orphaned by a previous crash before serving.
+    Directories are scanned in parallel, so adding more locations here
+    costs roughly nothing extra in startup latency.
+    """
+    cleanup_orphaned_temp_files_many([_HERE])
+
+# Electron polls /health continuously while waiting for the backend to
+# come up, so the response is serialized once at import: no dict
+# allocation, no json.dumps, no response-model validation per poll
+_HEALTH_RESPONSE = Response(content=b'{"status":"alive"}',
+                            media_type="application/json")
 
 @app.get("/health")
 def health_check():
     """Simple heartbeat to let Electron know Python is ready."""
-    return {"status": "alive"}
+    return _HEALTH_RESPONSE
 
 @app.post("/process-file")
-def process_file_endpoint(request: ProcessRequest):
+async def process_file_endpoint(file_path: str = Body(..., embed=True)):
     """
-    Receives a file path from Electron, runs your logic, 
+    Receives a file path from Electron, runs your logic,
     and returns the result.
+
+    The payload is a single field, so we take it via Body(embed=True)
+    instead of a pydantic model: FastAPI still validates that
+    file_path is a string, but skips building and allocating a model
+    instance on every request. The wire format ({"file_path": ...})
+    is unchanged.
+
+    The heavy lifting (openpyxl parse + save) runs in a worker thread
+    via asyncio.to_thread so the event loop stays free to answer
+    /health polls and other requests while a file is being processed.
     """
-    if not os.path.exists(request.file_path):
+    if not os.path.exists(file_path):
         raise HTTPException(status_code=404, detail="File not found")
 
     try:
         # We run your existing logic
         # Your logic modifies the file in-place (highlighting rows)
-        result_df = get_changed_rows(request.file_path)
-        
+        result_df = await asyncio.to_thread(get_changed_rows, file_path)
+
         # Determine status based on your return values
         changes_found = False
         if result_df is not None and not result_df.empty:
             changes_found = True
-        
+
         return {
             "status": "success",
             "message": "Processing complete",
             "changes_found": changes_found,
-            "processed_file": request.file_path
+            "processed_file": file_path
         }
     except Exception as e:
         # Capture any internal errors and send them to the UI
         print(f"Error processing file: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
 
+@app.post("/process-files")
+async def process_files_endpoint(request: BatchRequest):
+    """
+    Batch version of /process-file: takes a list of paths and fans them
+    out across the process pool, so N spreadsheets are parsed on up to
+    os.cpu_count() cores instead of serially. Returns one status dict
+    per file; a failure on one file doesn't abort the others.
+    """
+    loop = asyncio.get_running_loop()
+
+    async def process_one(file_path: str):
+        if not os.path.exists(file_path):
+            return {
+                "status": "error",
+                "message": "File not found",
+                "changes_found": False,
+                "processed_file": file_path
+            }
+        try:
+            result_df = await loop.run_in_executor(
+                EXECUTOR, get_changed_rows, file_path)
+
+            changes_found = result_df is not None and not result_df.empty
+
+            return {
+                "status": "success",
+                "message": "Processing complete",
+                "changes_found": changes_found,
+                "processed_file": file_path
+            }
+        except Exception as e:
+            print(f"Error processing file: {str(e)}")
+            return {
+                "status": "error",
+                "message": str(e),
+                "changes_found": False,
+                "processed_file": file_path
+            }
+
+    results = await asyncio.gather(
+        *(process_one(path) for path in request.file_paths))
+    return {"results": list(results)}
+
 if __name__ == "__main__":
     # Run the server on localhost port 8000
     # access_log=False keeps the console clean
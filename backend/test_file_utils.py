@@ -33,8 +33,11 @@ from file_utils import (
     atomic_rename,
     cleanup_temp_file,
     cleanup_orphaned_temp_files,
+    cleanup_orphaned_temp_files_many,
     atomic_write_context,
     atomic_save_workbook,
+    atomic_save_workbook_fast,
+    atomic_save_workbook_buffered,
 )
 
 
@@ -149,17 +152,102 @@ class TestAtomicRename:
         # Arrange
         src_file = tmp_path / "source.txt"
         dst_file = tmp_path / "new_file.txt"
-        
+
         src_file.write_text("content")
-        
+
         # Act
         atomic_rename(str(src_file), str(dst_file))
-        
+
         # Assert
         assert not src_file.exists()
         assert dst_file.exists()
         assert dst_file.read_text() == "content"
 
+    def test_no_replace_fails_if_destination_exists(self, tmp_path):
+        """
+        CONCURRENCY TEST: replace=False must refuse to clobber an
+        existing destination (atomic create-only mode).
+        """
+        # Arrange
+        src_file = tmp_path / "source.txt"
+        dst_file = tmp_path / "destination.txt"
+
+        src_file.write_text("new content")
+        dst_file.write_text("old content")
+
+        # Act & Assert
+        with pytest.raises(FileExistsError):
+            atomic_rename(str(src_file), str(dst_file), replace=False)
+
+        # Neither file should have been touched
+        assert src_file.exists()
+        assert dst_file.read_text() == "old content"
+
+    def test_no_replace_succeeds_if_destination_missing(self, tmp_path):
+        """replace=False should behave like a normal rename on a fresh target."""
+        # Arrange
+        src_file = tmp_path / "source.txt"
+        dst_file = tmp_path / "new_file.txt"
+
+        src_file.write_text("content")
+
+        # Act
+        atomic_rename(str(src_file), str(dst_file), replace=False)
+
+        # Assert
+        assert not src_file.exists()
+        assert dst_file.read_text() == "content"
+
+
+# =============================================================================
+# TEST: directory fd cache
+# =============================================================================
+
+class TestDirFdCache:
+    """Tests for the cached-directory-fd TTL and flush behavior."""
+
+    def test_idle_fd_evicted_after_ttl(self, tmp_path):
+        """
+        A cached dir fd pins its filesystem (blocks USB eject / unmount),
+        so entries idle past the TTL must be closed on the next sweep.
+        """
+        import file_utils
+
+        other_dir = tmp_path / "other"
+        other_dir.mkdir()
+        fd = file_utils._get_dir_fd(str(tmp_path))
+        assert fd is not None
+        assert file_utils._get_dir_fd(str(other_dir)) is not None
+
+        # Age the first entry past the TTL, then trigger a sweep via a
+        # cached hit on the other entry (no new fd is opened, so the
+        # closed fd number stays free for the fstat check below).
+        with file_utils._DIR_FD_LOCK:
+            file_utils._DIR_FD_CACHE[str(tmp_path)][1] -= (
+                file_utils._DIR_FD_TTL_SECONDS + 1)
+        file_utils._get_dir_fd(str(other_dir))
+
+        with file_utils._DIR_FD_LOCK:
+            assert str(tmp_path) not in file_utils._DIR_FD_CACHE
+        with pytest.raises(OSError):
+            os.fstat(fd)  # fd must actually be closed
+
+        file_utils._flush_dir_fds()
+
+    def test_flush_closes_all_cached_fds(self, tmp_path):
+        """_flush_dir_fds releases every handle immediately."""
+        import file_utils
+
+        fd = file_utils._get_dir_fd(str(tmp_path))
+        assert fd is not None
+
+        file_utils._flush_dir_fds()
+
+        with file_utils._DIR_FD_LOCK:
+            assert not file_utils._DIR_FD_CACHE
+        with pytest.raises(OSError):
+            os.fstat(fd)
+
 
 # =============================================================================
 # TEST: cleanup_temp_file()
@@ -250,10 +338,74 @@ class TestCleanupOrphanedTempFiles:
         """Should handle empty directory gracefully."""
         # Act
         deleted_count = cleanup_orphaned_temp_files(str(tmp_path))
-        
+
         # Assert
         assert deleted_count == 0
 
+    def test_unchanged_directory_skips_rescan(self, tmp_path):
+        """
+        POLLING TEST: A second call on an untouched directory should
+        be answered from the mtime cache without rescanning.
+        """
+        # Arrange: First scan deletes the orphan and primes the cache
+        orphan = tmp_path / f"{TEMP_FILE_PREFIX}abc_data.xlsx"
+        orphan.write_text("content")
+        assert cleanup_orphaned_temp_files(str(tmp_path)) == 1
+
+        # Act & Assert: Untouched directory -> no scandir at all
+        with patch('file_utils.os.scandir') as mock_scandir:
+            assert cleanup_orphaned_temp_files(str(tmp_path)) == 0
+            mock_scandir.assert_not_called()
+
+        # A new orphan bumps the directory mtime -> scanned again
+        late_orphan = tmp_path / f"{TEMP_FILE_PREFIX}xyz_data.xlsx"
+        late_orphan.write_text("content")
+        assert cleanup_orphaned_temp_files(str(tmp_path)) == 1
+
+
+# =============================================================================
+# TEST: cleanup_orphaned_temp_files_many()
+# =============================================================================
+
+class TestCleanupOrphanedTempFilesMany:
+    """Tests for the multi-directory parallel cleanup."""
+
+    def test_cleans_multiple_directories(self, tmp_path):
+        """Should sum deletions across all given directories."""
+        # Arrange: Two directories, each with one orphan and one keeper
+        dir_a = tmp_path / "a"
+        dir_b = tmp_path / "b"
+        dir_a.mkdir()
+        dir_b.mkdir()
+        (dir_a / f"{TEMP_FILE_PREFIX}one.xlsx").write_text("x")
+        (dir_b / f"{TEMP_FILE_PREFIX}two.xlsx").write_text("x")
+        (dir_b / "keep.xlsx").write_text("important")
+
+        # Act
+        deleted_count = cleanup_orphaned_temp_files_many(
+            [str(dir_a), str(dir_b)])
+
+        # Assert
+        assert deleted_count == 2
+        assert (dir_b / "keep.xlsx").exists()
+
+    def test_deduplicates_directories(self, tmp_path):
+        """The same directory given twice should only be scanned once."""
+        # Arrange
+        orphan = tmp_path / f"{TEMP_FILE_PREFIX}one.xlsx"
+        orphan.write_text("x")
+
+        # Act
+        deleted_count = cleanup_orphaned_temp_files_many(
+            [str(tmp_path), str(tmp_path)])
+
+        # Assert
+        assert deleted_count == 1
+
+    def test_handles_empty_iterable(self):
+        """No directories means nothing to do."""
+        assert cleanup_orphaned_temp_files_many([]) == 0
+
 
 # =============================================================================
 # TEST: atomic_write_context()
@@ -269,9 +421,8 @@ class TestAtomicWriteContext:
         target_file.write_text("original content")
         
         # Act
-        with atomic_write_context(str(target_file)) as temp_path:
-            with open(temp_path, 'w') as f:
-                f.write("new content")
+        with atomic_write_context(str(target_file)) as (f, temp_path):
+            f.write(b"new content")
         
         # Assert
         assert target_file.read_text() == "new content"
@@ -285,9 +436,8 @@ class TestAtomicWriteContext:
         
         # Act & Assert
         with pytest.raises(ValueError):
-            with atomic_write_context(str(target_file)) as temp_path:
-                with open(temp_path, 'w') as f:
-                    f.write("partial content")
+            with atomic_write_context(str(target_file)) as (f, temp_path):
+                f.write(b"partial content")
                 raise ValueError("Simulated error")
         
         # Original should be untouched
@@ -295,20 +445,78 @@ class TestAtomicWriteContext:
         # Temp file should be cleaned up
         assert not os.path.exists(temp_path)
     
-    def test_temp_file_in_same_directory(self, tmp_path):
-        """Temp file should be created in same directory as target."""
+    def test_durable_write_fsyncs_file_and_directory(self, tmp_path):
+        """
+        DURABILITY TEST: With durable=True (default), the temp file must
+        be fsync'd before the rename and the directory after it.
+        """
+        # Arrange
+        target_file = tmp_path / "data.txt"
+
+        # Act: Spy on os.fsync while performing a durable write
+        with patch('file_utils.os.fsync') as mock_fsync:
+            with atomic_write_context(str(target_file)) as (f, temp_path):
+                f.write(b"content")
+
+        # Assert: One fsync for the file, one for the parent directory
+        assert mock_fsync.call_count == 2
+        assert target_file.read_text() == "content"
+
+    def test_non_durable_write_skips_fsync(self, tmp_path):
+        """With durable=False, no fsync calls should be made."""
+        # Arrange
+        target_file = tmp_path / "data.txt"
+
+        # Act
+        with patch('file_utils.os.fsync') as mock_fsync:
+            with atomic_write_context(str(target_file), durable=False) as (f, temp_path):
+                f.write(b"content")
+
+        # Assert: No fsync, but the write still completed atomically
+        mock_fsync.assert_not_called()
+        assert target_file.read_text() == "content"
+
+    def test_temp_file_on_same_filesystem(self, tmp_path):
+        """
+        Temp storage must live on the same filesystem as the target.
+
+        On Linux the yielded path is a /proc/self/fd alias of an
+        anonymous inode in the target's directory; elsewhere it's a
+        visible temp file in that directory. Either way the backing
+        inode must share the target's filesystem so publishing it
+        (linkat or rename) is atomic, and sensitive data never leaks
+        to a system temp location.
+        """
         # Arrange
         target_file = tmp_path / "data.txt"
         target_file.write_text("content")
-        
+
         # Act
-        with atomic_write_context(str(target_file)) as temp_path:
-            # Assert: Check temp is in same directory
-            assert os.path.dirname(temp_path) == str(tmp_path)
-            
+        with atomic_write_context(str(target_file)) as (f, temp_path):
+            # Assert: Backing inode is on the target's filesystem
+            assert os.stat(temp_path).st_dev == os.stat(str(tmp_path)).st_dev
+
             # Write something so the context completes
-            with open(temp_path, 'w') as f:
-                f.write("content")
+            f.write(b"content")
+
+    def test_fallback_temp_file_in_same_directory(self, tmp_path):
+        """
+        Without O_TMPFILE support, the fallback must still create a
+        visible temp file in the same directory as the target.
+        """
+        # Arrange
+        target_file = tmp_path / "data.txt"
+        target_file.write_text("original")
+
+        # Act: Force the visible-temp-file fallback path
+        with patch('file_utils._open_anonymous_temp', return_value=None):
+            with atomic_write_context(str(target_file)) as (f, temp_path):
+                assert os.path.dirname(temp_path) == str(tmp_path)
+                f.write(b"new content")
+
+        # Assert
+        assert target_file.read_text() == "new content"
+        assert not os.path.exists(temp_path)
 
 
 # =============================================================================
@@ -392,6 +600,115 @@ class TestAtomicSaveWorkbook:
         assert len(temp_files) == 0
 
 
+# =============================================================================
+# TEST: atomic_save_workbook_fast()
+# =============================================================================
+
+class TestAtomicSaveWorkbookFast:
+    """Tests for the flat fast-path save variant."""
+
+    def test_saves_workbook_successfully(self, tmp_path):
+        """Fast path should produce the same result as the regular save."""
+        # Arrange
+        file_path = tmp_path / "test.xlsx"
+        wb = Workbook()
+        wb.active["A1"] = "Fast Value"
+
+        # Act
+        atomic_save_workbook_fast(wb, str(file_path))
+
+        # Assert
+        from openpyxl import load_workbook
+        loaded_wb = load_workbook(str(file_path))
+        assert loaded_wb.active["A1"].value == "Fast Value"
+
+    def test_preserves_original_on_save_error(self, tmp_path):
+        """If save fails, original file should be preserved."""
+        # Arrange: Create an existing file
+        file_path = tmp_path / "existing.xlsx"
+        original_wb = Workbook()
+        original_wb.active["A1"] = "Original"
+        original_wb.save(str(file_path))
+
+        mock_wb = Mock()
+        mock_wb.save.side_effect = Exception("Save failed")
+
+        # Act & Assert
+        with pytest.raises(Exception, match="Save failed"):
+            atomic_save_workbook_fast(mock_wb, str(file_path))
+
+        from openpyxl import load_workbook
+        loaded_wb = load_workbook(str(file_path))
+        assert loaded_wb.active["A1"].value == "Original"
+
+    def test_no_orphaned_temp_files(self, tmp_path):
+        """No temp files should remain after success or failure."""
+        # Arrange
+        file_path = tmp_path / "test.xlsx"
+        wb = Workbook()
+        wb.active["A1"] = "Test"
+        mock_wb = Mock()
+        mock_wb.save.side_effect = Exception("Save failed")
+
+        # Act: One successful and one failed save
+        atomic_save_workbook_fast(wb, str(file_path))
+        try:
+            atomic_save_workbook_fast(mock_wb, str(file_path))
+        except Exception:
+            pass
+
+        # Assert
+        files = list(tmp_path.iterdir())
+        temp_files = [f for f in files if f.name.startswith(TEMP_FILE_PREFIX)]
+        assert len(temp_files) == 0
+
+
+# =============================================================================
+# TEST: atomic_save_workbook_buffered()
+# =============================================================================
+
+class TestAtomicSaveWorkbookBuffered:
+    """Tests for the buffer-then-single-write save variant."""
+
+    def test_saves_workbook_successfully(self, tmp_path):
+        """Buffered save should produce a loadable workbook."""
+        # Arrange
+        file_path = tmp_path / "test.xlsx"
+        wb = Workbook()
+        wb.active["A1"] = "Buffered Value"
+
+        # Act
+        atomic_save_workbook_buffered(wb, str(file_path))
+
+        # Assert
+        from openpyxl import load_workbook
+        loaded_wb = load_workbook(str(file_path))
+        assert loaded_wb.active["A1"].value == "Buffered Value"
+
+    def test_preserves_original_on_save_error(self, tmp_path):
+        """A serialization failure must not touch the original file."""
+        # Arrange
+        file_path = tmp_path / "existing.xlsx"
+        original_wb = Workbook()
+        original_wb.active["A1"] = "Original"
+        original_wb.save(str(file_path))
+
+        mock_wb = Mock()
+        mock_wb.save.side_effect = Exception("Save failed")
+
+        # Act & Assert
+        with pytest.raises(Exception, match="Save failed"):
+            atomic_save_workbook_buffered(mock_wb, str(file_path))
+
+        # Original untouched, no temp files left
+        from openpyxl import load_workbook
+        loaded_wb = load_workbook(str(file_path))
+        assert loaded_wb.active["A1"].value == "Original"
+        temp_files = [f for f in tmp_path.iterdir()
+                      if f.name.startswith(TEMP_FILE_PREFIX)]
+        assert len(temp_files) == 0
+
+
 # =============================================================================
 # INTEGRATION TEST: Full Workflow
 # =============================================================================
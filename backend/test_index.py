@@ -31,6 +31,14 @@ class TestIndex(unittest.TestCase):
         self.assertEqual(normalize_value(123), "123")
         self.assertEqual(normalize_value(12.34), "12.34")
 
+    def test_normalize_value_bool_not_cached_as_number(self):
+        # True == 1.0 and False == 0.0, so an untyped lru_cache would
+        # return the numeric result for the boolean (and vice versa).
+        self.assertEqual(normalize_value(1.0), "1")
+        self.assertEqual(normalize_value(True), "True")
+        self.assertEqual(normalize_value(0.0), "0")
+        self.assertEqual(normalize_value(False), "False")
+
     def test_normalize_value_string(self):
         self.assertEqual(normalize_value("  hello  "), "hello")
         self.assertEqual(normalize_value("test"), "test")
@@ -214,9 +222,9 @@ class TestIndex(unittest.TestCase):
         self.assertEqual(sigs, ['']) # Empty string for out of bounds
 
     # --- highlight_rows Tests ---
-    @patch('index.atomic_save_workbook')
+    @patch('index.atomic_save_workbook_buffered')
     @patch('index.load_workbook')
-    @patch('index.PatternFill')
+    @patch('index._YELLOW_FILL')
     def test_highlight_rows_success(self, mock_fill, mock_load_wb, mock_atomic_save):
         mock_wb = MagicMock()
         mock_ws = MagicMock()
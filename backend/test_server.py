@@ -51,6 +51,49 @@ def test_process_file_not_found(mock_exists):
     assert response.status_code == 404
     assert response.json()["detail"] == "File not found"
 
+@patch("server.get_changed_rows")
+@patch("os.path.exists")
+def test_process_files_batch(mock_exists, mock_get_changed_rows):
+    mock_exists.return_value = True
+
+    mock_df = MagicMock()
+    mock_df.empty = False
+    mock_get_changed_rows.return_value = mock_df
+
+    # Use the loop's default (thread) executor so the patched
+    # get_changed_rows is visible to the workers
+    with patch("server.EXECUTOR", None):
+        response = client.post(
+            "/process-files",
+            json={"file_paths": ["a.xlsx", "b.xlsx"]}
+        )
+
+    assert response.status_code == 200
+    results = response.json()["results"]
+    assert len(results) == 2
+    assert all(r["status"] == "success" for r in results)
+    assert all(r["changes_found"] is True for r in results)
+    assert [r["processed_file"] for r in results] == ["a.xlsx", "b.xlsx"]
+
+@patch("server.get_changed_rows")
+@patch("os.path.exists")
+def test_process_files_batch_partial_failure(mock_exists, mock_get_changed_rows):
+    # First file exists, second doesn't
+    mock_exists.side_effect = [True, False]
+    mock_get_changed_rows.return_value = None
+
+    with patch("server.EXECUTOR", None):
+        response = client.post(
+            "/process-files",
+            json={"file_paths": ["a.xlsx", "missing.xlsx"]}
+        )
+
+    assert response.status_code == 200
+    results = response.json()["results"]
+    assert results[0]["status"] == "success"
+    assert results[1]["status"] == "error"
+    assert results[1]["message"] == "File not found"
+
 @patch("server.get_changed_rows")
 @patch("os.path.exists")
 def test_process_file_internal_error(mock_exists, mock_get_changed_rows):